@@ -1,8 +1,13 @@
 # agent.py - Voice Game Master (D&D-Style Adventure) for Day 8
+import asyncio
+import contextlib
+import copy
+import itertools
 import logging
 import os
 import json
 import random
+import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
@@ -127,13 +132,23 @@ GAME MASTER GUIDELINES:
     }
 }
 
+# Cap on the event history kept in (and saved with) the world state
+MAX_GAME_EVENTS = 50
+
+# Suffix for save filenames so saves within the same nanosecond stay distinct
+SAVE_COUNTER = itertools.count()
+
 # ---------- Murf TTS voices ---------- #
 
+# Narration is streamed to Murf one sentence at a time as the LLM produces it.
+# A sentence is released once the next one has begun; the smaller
+# stream_context_len only trims the wait while the buffer is still very short.
 TTS_GAME_MASTER = murf.TTS(
     voice="en-US-matthew",
     style="Story",
-    tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2),
-    text_pacing=True,
+    tokenizer=tokenize.basic.SentenceTokenizer(min_sentence_len=2, stream_context_len=2),
+    # Pacing smooths prosody across chunks but holds back the first audio bytes.
+    text_pacing=False,
 )
 
 # ---------- Game Master Agent ---------- #
@@ -159,7 +174,8 @@ class GameMasterAgent(Agent):
         universe_config = GAME_UNIVERSES[self.universe]
 
         if "initial_world" in universe_config:
-            game_state["world"] = universe_config["initial_world"].copy()
+            # Deep copy so sessions never append to the shared template's lists
+            game_state["world"] = copy.deepcopy(universe_config["initial_world"])
 
         # Start the adventure
         await self.session.generate_reply(
@@ -250,7 +266,10 @@ class GameMasterAgent(Agent):
         if "events" not in game_state["world"]:
             game_state["world"]["events"] = []
 
-        game_state["world"]["events"].append(event)
+        events = game_state["world"]["events"]
+        events.append(event)
+        # Keep only the most recent events so long sessions don't grow unbounded
+        del events[:-MAX_GAME_EVENTS]
         logger.info(f"Game event recorded: {event}")
 
         return f"Event '{event}' added to game history."
@@ -277,8 +296,8 @@ class GameMasterAgent(Agent):
         session = context.session
         game_state = _ensure_game_state(session)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"game_save_{timestamp}.json"
+        # Nanoseconds plus a per-process counter: saves in the same second don't clobber
+        filename = f"game_save_{time.time_ns()}_{next(SAVE_COUNTER)}.json"
 
         save_data = {
             "timestamp": datetime.now().isoformat(),
@@ -287,8 +306,9 @@ class GameMasterAgent(Agent):
             "summary": f"Adventure in {GAME_UNIVERSES[self.universe]['name']}"
         }
 
-        with open(filename, 'w') as f:
-            json.dump(save_data, f, indent=2)
+        # Serialize here so other tools can't mutate the world mid-dump
+        data = json.dumps(save_data, indent=2).encode("utf-8")
+        await asyncio.to_thread(_write_save, filename, data)
 
         logger.info(f"Game saved to {filename}")
         return f"Game saved successfully! File: {filename}"
@@ -344,6 +364,21 @@ def _ensure_game_state(session) -> Dict[str, Any]:
         ud["game"] = game
     return game
 
+def _write_save(filename: str, data: bytes) -> None:
+    """Atomically write a save file; runs off the event loop so audio keeps streaming"""
+    tmp_filename = f"{filename}.tmp"
+    try:
+        with open(tmp_filename, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        # Don't leave a half-written temp file behind
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_filename)
+        raise
+
 # ---------- Prewarm ---------- #
 
 def prewarm(proc: JobProcess):
@@ -359,13 +394,19 @@ async def entrypoint(ctx: JobContext):
 
     session = AgentSession(
         stt=deepgram.STT(model="nova-3"),
+        # Thinking is off so no hidden reasoning tokens precede the narration; the
+        # output cap only guards against runaway replies, scenes fit well within it.
         llm=google.LLM(
             model="gemini-2.5-flash",
+            max_output_tokens=512,
+            thinking_config={"thinking_budget": 0},
         ),
         tts=TTS_GAME_MASTER,
         turn_detection=MultilingualModel(),
         vad=ctx.proc.userdata["vad"],
         preemptive_generation=True,
+        # Hand off sooner once the turn detector is confident the player is done
+        min_endpointing_delay=0.3,
     )
 
     # Initialize userdata; game state lives under session.userdata["game"]